@@ -64,6 +64,9 @@ class CLISocketClient:
         # interleave with command responses.
         self._io_lock = threading.Lock()
         self._connected = False
+        # Timeout currently applied to the socket; settimeout() is a
+        # syscall, so it is only reissued when the value changes.
+        self._timeout: float | None = None
 
     # --- Connection lifecycle ---
 
@@ -121,12 +124,13 @@ class CLISocketClient:
             sock.connect(path)
             self._sock = sock
             self._buffer = ""
+            self._timeout = CONNECTION_TIMEOUT
         except OSError as exc:
             raise CLIConnectionError(f"Cannot connect to {path}: {exc}") from exc
 
         # Verify with ping
         try:
-            self._sock.settimeout(PING_TIMEOUT)
+            self._set_timeout(PING_TIMEOUT)
             self._sock.sendall(f"{COMMAND_PREFIX}ping\n".encode())
             line = self._read_line_raw(PING_TIMEOUT)
             if not line.startswith(OK_PREFIX) or line[len(OK_PREFIX) :] != "pong":
@@ -149,6 +153,7 @@ class CLISocketClient:
                 pass
             self._sock = None
         self._buffer = ""
+        self._timeout = None
 
     @property
     def is_connected(self) -> bool:
@@ -184,6 +189,40 @@ class CLISocketClient:
 
             return self._read_response(timeout)
 
+    def send_many(
+        self, commands: list[str], timeout: float = COMMAND_TIMEOUT
+    ) -> list[CLIResponse]:
+        """Send several commands in one write and read their responses.
+
+        The server answers commands in order on a connection, so all
+        CMD: frames are written with a single sendall() and the responses
+        are read back from the shared buffer afterwards.
+
+        Args:
+            commands: Command strings (without CMD: prefix or newline).
+            timeout: Maximum seconds to wait for each response.
+
+        Returns:
+            One CLIResponse per command, in the same order.
+
+        Raises:
+            CLIConnectionError: If the socket is closed or times out.
+        """
+        if self._sock is None:
+            raise CLIConnectionError("Not connected")
+
+        with self._io_lock:
+            wire = bytearray()
+            for command in commands:
+                wire += f"{COMMAND_PREFIX}{command}\n".encode()
+            try:
+                self._sock.sendall(wire)
+            except OSError as exc:
+                self._connected = False
+                raise CLIConnectionError(f"Send failed: {exc}") from exc
+
+            return [self._read_response(timeout) for _ in commands]
+
     def send_raw(self, command: str, timeout: float = COMMAND_TIMEOUT) -> str:
         """Send a command and return the raw payload string.
 
@@ -238,7 +277,7 @@ class CLISocketClient:
         if self._sock is None:
             raise CLIConnectionError("Not connected")
 
-        self._sock.settimeout(timeout)
+        self._set_timeout(timeout)
 
         while "\n" not in self._buffer:
             try:
@@ -258,6 +297,12 @@ class CLISocketClient:
         line, self._buffer = self._buffer.split("\n", 1)
         return line
 
+    def _set_timeout(self, timeout: float) -> None:
+        """Apply a socket timeout, skipping the syscall when unchanged."""
+        if timeout != self._timeout:
+            self._sock.settimeout(timeout)
+            self._timeout = timeout
+
     # --- Background event reader ---
 
     def _start_event_reader(self) -> None:
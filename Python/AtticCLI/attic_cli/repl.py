@@ -127,9 +127,16 @@ def run_repl(client: CLISocketClient) -> None:
             # --- Mode-specific command translation ---
             commands = _translate_for_mode(trimmed, mode)
 
-            for cmd in commands:
+            # Multi-command translations (e.g. "g $E000") go out as one
+            # write; responses come back in order.
+            try:
+                responses = client.send_many(commands)
+            except Exception as exc:
+                console.print(f"[red]Error:[/red] {exc}")
+                responses = []
+
+            for cmd, response in zip(commands, responses):
                 try:
-                    response = client.send(cmd)
                     if response.success:
                         payload = response.payload
 
@@ -5,8 +5,72 @@ that AtticServer understands. Each translate function returns a list of
 protocol command strings (some user commands expand to multiple commands).
 """
 
+import re
+from collections.abc import Callable
+
 from .cli_client import escape_for_inject
 
+# Splits a monitor command into its verb and the (optional) remainder.
+# Compiled once at import so each translation is a single match() call.
+_MON_RE = re.compile(r"\s*(?P<verb>\S+)(?:\s+(?P<args>.*))?")
+
+
+def _monitor_go(args: str) -> list[str]:
+    """Translate ``g [addr]``."""
+    if args:
+        # Go to address: set PC then resume
+        return [f"registers pc={args}", "resume"]
+    return ["resume"]
+
+
+def _monitor_memory(args: str) -> list[str]:
+    """Translate ``m addr [count]``."""
+    if args:
+        # Default to 16 bytes when only an address is given
+        if len(args.split()) == 1:
+            return [f"read {args} 16"]
+        return [f"read {args}"]
+    return ["read"]
+
+
+def _monitor_breakpoint(args: str) -> list[str]:
+    """Translate ``b``/``bp [addr]``."""
+    # Breakpoint set: b $addr or bp $addr
+    if args:
+        return [f"breakpoint set {args}"]
+    return ["breakpoint list"]
+
+
+def _monitor_breakpoint_clear(args: str) -> list[str]:
+    """Translate ``bc [addr|*]``."""
+    if args == "*":
+        return ["breakpoint clearall"]
+    if args:
+        return [f"breakpoint clear {args}"]
+    return ["breakpoint list"]
+
+
+# Monitor verb dispatch. Most verbs just prefix a fixed protocol command
+# onto the arguments; those are stored as (prefix, takes_args) so dispatch
+# needs no call. Only verbs with real logic get a handler function.
+_MONITOR_TABLE: dict[str, tuple[str, bool] | Callable[[str], list[str]]] = {
+    "g": _monitor_go,
+    "s": ("step", True),
+    "p": ("pause", False),
+    "pause": ("pause", False),
+    "until": ("run_until", True),
+    "r": ("registers", True),
+    "m": _monitor_memory,
+    ">": ("write", True),
+    "f": ("fill", True),
+    "d": ("disassemble", True),
+    "a": ("assemble", True),
+    "b": _monitor_breakpoint,
+    "bp": _monitor_breakpoint,
+    "bc": _monitor_breakpoint_clear,
+    "bl": ("breakpoint list", False),
+}
+
 
 def translate_monitor(line: str) -> list[str]:
     """Translate a monitor mode command to protocol strings.
@@ -17,78 +81,20 @@ def translate_monitor(line: str) -> list[str]:
     Returns:
         List of protocol command strings to send to the server.
     """
-    parts = line.split(None, 1)
-    cmd = parts[0].lower()
-    args = parts[1] if len(parts) > 1 else ""
-
-    match cmd:
-        case "g":
-            if args:
-                # Go to address: set PC then resume
-                return [f"registers pc={args}", "resume"]
-            return ["resume"]
-
-        case "s":
-            if args:
-                return [f"step {args}"]
-            return ["step"]
-
-        case "p" | "pause":
-            return ["pause"]
-
-        case "until":
-            return [f"run_until {args}"] if args else ["run_until"]
-
-        case "r":
-            if args:
-                return [f"registers {args}"]
-            return ["registers"]
-
-        case "m":
-            if args:
-                # Default to 16 bytes when only an address is given
-                arg_parts = args.split()
-                if len(arg_parts) == 1:
-                    return [f"read {args} 16"]
-                return [f"read {args}"]
-            return ["read"]
-
-        case ">":
-            return [f"write {args}"] if args else ["write"]
-
-        case "f":
-            return [f"fill {args}"] if args else ["fill"]
-
-        case "d":
-            if args:
-                return [f"disassemble {args}"]
-            return ["disassemble"]
-
-        case "a":
-            if args:
-                return [f"assemble {args}"]
-            return ["assemble"]
-
-        case "b" | "bp":
-            # Breakpoint set: b $addr or bp $addr
-            if args:
-                return [f"breakpoint set {args}"]
-            return ["breakpoint list"]
-
-        case "bc":
-            # Breakpoint clear
-            if args == "*":
-                return ["breakpoint clearall"]
-            if args:
-                return [f"breakpoint clear {args}"]
-            return ["breakpoint list"]
-
-        case "bl":
-            return ["breakpoint list"]
-
-        case _:
-            # Pass through as-is for any unrecognized commands
-            return [line]
+    m = _MON_RE.fullmatch(line)
+    if m is None:
+        return [line]
+
+    entry = _MONITOR_TABLE.get(m.group("verb").lower())
+    if entry is None:
+        # Pass through as-is for any unrecognized commands
+        return [line]
+
+    args = m.group("args") or ""
+    if type(entry) is tuple:
+        prefix, takes_args = entry
+        return [f"{prefix} {args}"] if takes_args and args else [prefix]
+    return entry(args)
 
 
 def translate_basic(line: str, *, atascii: bool = True) -> list[str]:
@@ -1,8 +1,16 @@
 """Tests for the CLI socket client helpers."""
 
+import socket
+from unittest.mock import MagicMock
+
 import pytest
 
-from attic_cli.cli_client import escape_for_inject, parse_hex_bytes, translate_key
+from attic_cli.cli_client import (
+    CLISocketClient,
+    escape_for_inject,
+    parse_hex_bytes,
+    translate_key,
+)
 
 
 class TestParseHexBytes:
@@ -106,3 +114,31 @@ class TestTranslateKey:
 
     def test_unrecognized_passthrough(self):
         assert translate_key("F1") == "F1"
+
+
+class TestSendMany:
+    def test_single_write_ordered_responses(self):
+        client = CLISocketClient()
+        local, remote = socket.socketpair()
+        client._sock = local
+        try:
+            remote.sendall(b"OK:\nEVENT:stopped $E000\nOK:resumed\n")
+            responses = client.send_many(["registers pc=$E000", "resume"])
+            assert remote.recv(4096) == b"CMD:registers pc=$E000\nCMD:resume\n"
+            assert [r.payload for r in responses] == ["", "resumed"]
+            assert len(client.drain_events()) == 1
+        finally:
+            local.close()
+            remote.close()
+
+
+class TestTimeoutCache:
+    def test_settimeout_only_when_changed(self):
+        client = CLISocketClient()
+        sock = MagicMock()
+        sock.recv.side_effect = [b"OK:a\n", b"OK:b\n", b"OK:c\n"]
+        client._sock = sock
+        client.send("status")
+        client.send("status")
+        client.send("status", timeout=1.0)
+        assert [c.args for c in sock.settimeout.call_args_list] == [(30.0,), (1.0,)]
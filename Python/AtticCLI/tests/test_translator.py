@@ -81,6 +81,11 @@ class TestTranslateMonitor:
         assert translate_monitor("G $E000") == ["registers pc=$E000", "resume"]
         assert translate_monitor("D $E000") == ["disassemble $E000"]
 
+    def test_extra_whitespace_between_verb_and_args(self):
+        assert translate_monitor("m \t $0600") == ["read $0600 16"]
+        assert translate_monitor("d  $E000 20") == ["disassemble $E000 20"]
+        assert translate_monitor(" m $0600") == ["read $0600 16"]
+
 
 class TestTranslateBasic:
     def test_list(self):
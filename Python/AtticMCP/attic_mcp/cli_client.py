@@ -17,18 +17,21 @@ the corresponding PID is still alive.
 
 Usage from an async context (FastMCP tools are async):
 
-    client = CLISocketClient()
+    client = AsyncCLISocketClient()
     path = client.discover_socket()
-    client.connect(path)
-    result = await asyncio.to_thread(client.send, "status")
+    await client.connect(path)
+    result = await client.send("status")
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import glob
 import logging
 import os
 import socket
+import sys
 
 # ---------------------------------------------------------------------------
 # Protocol constants — must match Sources/AtticCore/CLIProtocol.swift
@@ -41,12 +44,16 @@ EVENT_PREFIX = "EVENT:"
 
 # Multi-line responses join lines with this character (ASCII Record Separator).
 MULTI_LINE_SEP = "\x1e"
+_MULTI_LINE_SEP_BYTES = MULTI_LINE_SEP.encode("ascii")
 
 # Timeouts in seconds.
 COMMAND_TIMEOUT = 30.0
 PING_TIMEOUT = 1.0
 CONNECTION_TIMEOUT = 5.0
 
+# Maximum number of concurrent connections the MCP server opens to AtticServer.
+POOL_SIZE = 4
+
 # Socket path pattern.
 SOCKET_PATH_PREFIX = "/tmp/attic-"
 SOCKET_PATH_SUFFIX = ".sock"
@@ -54,8 +61,16 @@ SOCKET_PATH_SUFFIX = ".sock"
 # Maximum bytes to read in one recv() call.
 MAX_RECV = 4096
 
+# Maximum length of one response line for the asyncio stream reader.  The
+# default StreamReader limit (64 KiB) is too small for long BASIC listings.
+MAX_LINE = 1024 * 1024
+
 logger = logging.getLogger("attic-mcp.cli")
 
+# ``asyncio.timeout()`` (3.11+) bounds an await in place; ``wait_for()``
+# on 3.10/3.11 wraps every read in an extra Task and loop iteration.
+_HAS_ASYNC_TIMEOUT = sys.version_info >= (3, 11)
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -69,6 +84,10 @@ class CLIConnectionError(Exception):
     """Raised when the server is unreachable or the socket is broken."""
 
 
+class CLITimeoutError(CLIConnectionError):
+    """Raised when a read times out on a connection that is still open."""
+
+
 # ---------------------------------------------------------------------------
 # Socket client
 # ---------------------------------------------------------------------------
@@ -76,10 +95,9 @@ class CLIConnectionError(Exception):
 class CLISocketClient:
     """Synchronous Unix domain socket client for the AtticServer CLI protocol.
 
-    This client is intentionally synchronous — the FastMCP server bridges to
-    async via ``asyncio.to_thread()``.  Keeping socket I/O synchronous avoids
-    the complexity of async socket handling for what is a simple request/response
-    protocol with a single connection.
+    This client is synchronous and suits scripts and other blocking callers.
+    The FastMCP server uses :class:`AsyncCLISocketClient` instead, which
+    awaits socket I/O on the event loop without a worker-thread hop.
 
     Typical lifecycle::
 
@@ -94,6 +112,9 @@ class CLISocketClient:
     def __init__(self) -> None:
         self._sock: socket.socket | None = None
         self._buffer: str = ""
+        # Timeout currently applied to the socket.  ``settimeout()`` is a
+        # syscall, so it is only reissued when the value changes.
+        self._timeout: float | None = None
 
     # -- Socket discovery ---------------------------------------------------
 
@@ -103,41 +124,7 @@ class CLISocketClient:
         Stale sockets (whose PID no longer exists) are cleaned up automatically.
         Returns the path to the best socket, or ``None`` if none found.
         """
-        pattern = f"{SOCKET_PATH_PREFIX}*{SOCKET_PATH_SUFFIX}"
-        candidates: list[tuple[float, str]] = []
-
-        for path in glob.glob(pattern):
-            # Extract PID from the filename: /tmp/attic-<pid>.sock
-            basename = os.path.basename(path)
-            pid_str = basename.removeprefix("attic-").removesuffix(".sock")
-            try:
-                pid = int(pid_str)
-            except ValueError:
-                continue
-
-            # Check if the process is still alive.
-            if not _pid_alive(pid):
-                # Clean up stale socket file.
-                try:
-                    os.unlink(path)
-                    logger.debug("Removed stale socket: %s", path)
-                except OSError:
-                    pass
-                continue
-
-            # Use modification time for sorting (most recent first).
-            try:
-                mtime = os.path.getmtime(path)
-            except OSError:
-                continue
-            candidates.append((mtime, path))
-
-        if not candidates:
-            return None
-
-        # Sort by modification time, most recent first.
-        candidates.sort(key=lambda t: t[0], reverse=True)
-        return candidates[0][1]
+        return _discover_socket()
 
     # -- Connection ---------------------------------------------------------
 
@@ -154,6 +141,7 @@ class CLISocketClient:
             sock.connect(path)
             self._sock = sock
             self._buffer = ""
+            self._timeout = CONNECTION_TIMEOUT
             logger.info("Connected to %s", path)
         except OSError as exc:
             raise CLIConnectionError(f"Cannot connect to {path}: {exc}") from exc
@@ -176,6 +164,7 @@ class CLISocketClient:
                 pass
             self._sock = None
             self._buffer = ""
+            self._timeout = None
             logger.info("Disconnected")
 
     @property
@@ -202,7 +191,7 @@ class CLISocketClient:
         # Format and send the command.
         wire = f"{COMMAND_PREFIX}{command}\n"
         try:
-            self._sock.settimeout(timeout)
+            self._set_timeout(timeout)
             self._sock.sendall(wire.encode("utf-8"))
         except OSError as exc:
             self.disconnect()
@@ -235,7 +224,7 @@ class CLISocketClient:
         if self._sock is None:
             raise CLIConnectionError("Not connected")
 
-        self._sock.settimeout(timeout)
+        self._set_timeout(timeout)
 
         while "\n" not in self._buffer:
             try:
@@ -258,6 +247,360 @@ class CLISocketClient:
         line, self._buffer = self._buffer.split("\n", 1)
         return line
 
+    def _set_timeout(self, timeout: float) -> None:
+        """Apply a socket timeout, skipping the syscall when unchanged."""
+        if timeout != self._timeout:
+            self._sock.settimeout(timeout)
+            self._timeout = timeout
+
+
+class AsyncCLISocketClient:
+    """Asyncio Unix domain socket client for the AtticServer CLI protocol.
+
+    Speaks the same protocol as :class:`CLISocketClient`, but over asyncio
+    streams so FastMCP tool handlers can await socket I/O directly on the
+    event loop instead of hopping through ``asyncio.to_thread()``.
+
+    Passing ``lines=True`` to :meth:`send` or :meth:`send_pipeline` returns
+    multi-line payloads joined with ``"\\n"`` rather than
+    :data:`MULTI_LINE_SEP`; the conversion happens on the raw bytes, before
+    the one decode every reply needs anyway.
+
+    Typical lifecycle::
+
+        client = AsyncCLISocketClient()
+        path = client.discover_socket()
+        if path:
+            await client.connect(path)
+            result = await client.send("status")
+        client.disconnect()
+    """
+
+    def __init__(self) -> None:
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        # One command in flight per connection: responses carry no request
+        # ID, so concurrent tool calls must not interleave on the socket.
+        self._lock = asyncio.Lock()
+        # Replies still owed for commands whose read timed out.  The server
+        # answers in order, so these are discarded before the next reply
+        # instead of tearing down a healthy connection.
+        self._stale = 0
+
+    # -- Socket discovery ---------------------------------------------------
+
+    def discover_socket(self) -> str | None:
+        """Find the most recently modified ``/tmp/attic-*.sock`` with a live PID.
+
+        This is a blocking filesystem scan; see :func:`_discover_socket`.
+        """
+        return _discover_socket()
+
+    # -- Connection ---------------------------------------------------------
+
+    async def connect(self, path: str) -> None:
+        """Connect to the given Unix socket and verify with a ping.
+
+        Raises ``CLIConnectionError`` if the socket cannot be reached or the
+        ping handshake fails.
+        """
+        self.disconnect()  # Clean up any previous connection.
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(path, limit=MAX_LINE),
+                CONNECTION_TIMEOUT,
+            )
+            logger.info("Connected to %s", path)
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise CLIConnectionError(f"Cannot connect to {path}: {exc}") from exc
+
+        # Verify the connection with a ping handshake.
+        try:
+            response = await self.send("ping", timeout=PING_TIMEOUT)
+            if response != "pong":
+                raise CLIConnectionError(f"Unexpected ping response: {response!r}")
+        except Exception as exc:
+            self.disconnect()
+            raise CLIConnectionError(f"Ping handshake failed: {exc}") from exc
+
+    def disconnect(self) -> None:
+        """Close the stream connection if open."""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except OSError:
+                pass
+            self._reader = None
+            self._writer = None
+            self._stale = 0
+            logger.info("Disconnected")
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the stream is currently open.
+
+        Stays ``True`` after a read timeout; only a broken stream (EOF or
+        socket error) disconnects the client.  An EOF the server sent while
+        the client sat idle counts as broken before any read sees it.
+        """
+        return self._writer is not None and not self._reader.at_eof()
+
+    # -- Command execution --------------------------------------------------
+
+    async def send(
+        self, command: str, timeout: float = COMMAND_TIMEOUT, lines: bool = False
+    ) -> str:
+        """Send a CLI command and return the OK payload.
+
+        With *lines*, :data:`MULTI_LINE_SEP` in the payload becomes ``"\\n"``.
+
+        Raises:
+            CLIError: If the server returns ``ERR:<message>``.
+            CLIConnectionError: If the stream is not connected or the read
+                times out / fails.
+        """
+        async with self._lock:
+            if self._writer is None:
+                raise CLIConnectionError("Not connected to AtticServer")
+
+            try:
+                self._writer.write(f"{COMMAND_PREFIX}{command}\n".encode("utf-8"))
+                await self._writer.drain()
+            except OSError as exc:
+                self.disconnect()
+                raise CLIConnectionError(f"Send failed: {exc}") from exc
+            except asyncio.CancelledError:
+                self.disconnect()
+                raise
+
+            try:
+                line = await self._read_reply(timeout, lines)
+            except CLITimeoutError:
+                # Timed out on a live stream — our reply is still owed.
+                self._stale += 1
+                raise
+            except asyncio.CancelledError:
+                # Cancelled mid-exchange: the stream position is unknown, so
+                # drop it rather than let the pool hand out a shifted reader.
+                self.disconnect()
+                raise
+
+        return _parse_reply(line)
+
+    async def send_pipeline(
+        self,
+        commands: list[str],
+        timeout: float = COMMAND_TIMEOUT,
+        lines: bool = False,
+        return_exceptions: bool = False,
+    ) -> list[str | CLIError]:
+        """Send several CLI commands in one write and return their payloads.
+
+        The server answers a connection's commands in order, so all
+        ``CMD:`` lines are flushed together and the replies read back
+        afterwards — one round trip instead of ``len(commands)``.  Every
+        reply is read before raising, so an ``ERR:`` for one command leaves
+        the stream in sync; later commands have still been executed.
+        *lines* converts separators as in :meth:`send`.  With
+        *return_exceptions*, each ``ERR:`` reply comes back in its slot as a
+        :class:`CLIError` instead of being raised, as with
+        :func:`asyncio.gather`.
+
+        Raises:
+            CLIError: For the first ``ERR:<message>`` reply, unless
+                *return_exceptions* is set.
+            CLIConnectionError: If the stream is not connected or a read
+                times out / fails.
+        """
+        async with self._lock:
+            if self._writer is None:
+                raise CLIConnectionError("Not connected to AtticServer")
+
+            wire = "".join(f"{COMMAND_PREFIX}{command}\n" for command in commands)
+            try:
+                self._writer.write(wire.encode("utf-8"))
+                await self._writer.drain()
+            except OSError as exc:
+                self.disconnect()
+                raise CLIConnectionError(f"Send failed: {exc}") from exc
+            except asyncio.CancelledError:
+                self.disconnect()
+                raise
+
+            replies: list[str] = []
+            try:
+                while len(replies) < len(commands):
+                    replies.append(await self._read_reply(timeout, lines))
+            except CLITimeoutError:
+                self._stale += len(commands) - len(replies)
+                raise
+            except asyncio.CancelledError:
+                self.disconnect()
+                raise
+
+        results: list[str | CLIError] = []
+        error: CLIError | None = None
+        for line in replies:
+            try:
+                results.append(_parse_reply(line))
+            except CLIError as exc:
+                results.append(exc)
+                error = error or exc
+        if error is not None and not return_exceptions:
+            raise error
+        return results
+
+    # -- Internal helpers ---------------------------------------------------
+
+    async def _read_reply(self, timeout: float, lines: bool = False) -> str:
+        """Read the next reply line, skipping events and stale replies."""
+        while True:
+            line = await self._read_line(timeout, lines)
+            if line.startswith(EVENT_PREFIX):
+                # Events are asynchronous notifications — skip them and
+                # keep reading for the actual response.
+                logger.debug("Received event during command: %s", line)
+            elif self._stale:
+                logger.debug("Discarded late response: %s", line)
+                self._stale -= 1
+            else:
+                return line
+
+    async def _read_line(self, timeout: float, lines: bool = False) -> str:
+        """Read one newline-terminated line from the stream.
+
+        Returns the line without the trailing newline; with *lines*, any
+        :data:`MULTI_LINE_SEP` separators are turned into newlines.
+
+        Framing stays newline-terminated because the CLI protocol is
+        fixed; ``readuntil`` finds the terminator with a C-level search of
+        the buffered bytes, so even multi-KB disassembly or BASIC listings
+        cost one scan and one copy, much as a length prefix would.
+        """
+        if self._reader is None:
+            raise CLIConnectionError("Not connected")
+
+        try:
+            if _HAS_ASYNC_TIMEOUT:
+                async with asyncio.timeout(timeout):
+                    raw = await self._reader.readuntil(b"\n")
+            else:
+                raw = await asyncio.wait_for(self._reader.readuntil(b"\n"), timeout)
+        except asyncio.TimeoutError as exc:
+            raise CLITimeoutError(f"Read timed out after {timeout}s") from exc
+        except asyncio.IncompleteReadError as exc:
+            self.disconnect()
+            raise CLIConnectionError("Connection closed by server") from exc
+        except (OSError, asyncio.LimitOverrunError) as exc:
+            self.disconnect()
+            raise CLIConnectionError(f"Read failed: {exc}") from exc
+
+        raw = raw[:-1]
+        if lines:
+            raw = raw.replace(_MULTI_LINE_SEP_BYTES, b"\n")
+        return raw.decode("utf-8", errors="replace")
+
+
+class CLIConnectionPool:
+    """A small pool of :class:`AsyncCLISocketClient` connections.
+
+    Each connection carries one command at a time, so a single shared
+    connection serializes every tool call.  The pool lets independent tool
+    calls run concurrently on AtticServer, opening connections lazily up to
+    ``size`` and discarding any that break.
+
+    Typical lifecycle::
+
+        pool = CLIConnectionPool()
+        await pool.open(path)             # connect + ping the first slot
+        async with pool.acquire() as client:
+            result = await client.send("status")
+        pool.close()
+    """
+
+    def __init__(self, size: int = POOL_SIZE) -> None:
+        self._path: str | None = None
+        # Last path open() verified; kept across close() so a reconnect can
+        # skip discovery, and cleared only when connecting to it fails.
+        self._last_known_path: str | None = None
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[AsyncCLISocketClient] = []
+        # Bumped by close() so connections checked out before a reset are
+        # dropped on release instead of rejoining the pool.
+        self._generation = 0
+
+    def discover_socket(self) -> str | None:
+        """Find the most recently modified ``/tmp/attic-*.sock`` with a live PID.
+
+        This is a blocking filesystem scan; see :func:`_discover_socket`.
+        """
+        return _discover_socket()
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the pool has a verified AtticServer socket path."""
+        return self._path is not None
+
+    @property
+    def last_known_path(self) -> str | None:
+        """Return the socket path last opened successfully, if any."""
+        return self._last_known_path
+
+    async def open(self, path: str) -> None:
+        """Point the pool at ``path`` and verify it with one connection.
+
+        Raises ``CLIConnectionError`` if the first connection fails.
+        """
+        self.close()
+        client = AsyncCLISocketClient()
+        try:
+            await client.connect(path)
+        except CLIConnectionError:
+            if path == self._last_known_path:
+                self._last_known_path = None
+            raise
+        self._path = self._last_known_path = path
+        self._idle.append(client)
+
+    def close(self) -> None:
+        """Disconnect idle connections and forget the socket path."""
+        for client in self._idle:
+            client.disconnect()
+        self._idle.clear()
+        self._path = None
+        self._generation += 1
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        """Check out a connection for exclusive use.
+
+        Commands that depend on per-connection server state (such as an
+        interactive assembly session) must be sent within one ``acquire()``.
+        """
+        async with self._slots:
+            if self._path is None:
+                raise CLIConnectionError("Not connected to AtticServer")
+            generation = self._generation
+            client = None
+            while self._idle:
+                client = self._idle.pop()
+                if client.is_connected:
+                    break
+                # Closed by the server while idle (e.g. it restarted).
+                client.disconnect()
+                client = None
+            if client is None:
+                client = AsyncCLISocketClient()
+                await client.connect(self._path)
+            try:
+                yield client
+            finally:
+                if generation == self._generation and client.is_connected:
+                    self._idle.append(client)
+                else:
+                    # Broken or stale — a replacement is opened on demand.
+                    client.disconnect()
+
 
 # ---------------------------------------------------------------------------
 # Helper functions for tool argument processing
@@ -373,6 +716,60 @@ def escape_for_inject(text: str) -> str:
 # Internal utilities
 # ---------------------------------------------------------------------------
 
+def _parse_reply(line: str) -> str:
+    """Return the payload of an ``OK:`` line or raise ``CLIError``."""
+    if line.startswith(OK_PREFIX):
+        return line[len(OK_PREFIX):]
+    elif line.startswith(ERROR_PREFIX):
+        raise CLIError(line[len(ERROR_PREFIX):])
+    else:
+        raise CLIError(f"Unexpected response: {line!r}")
+
+
+def _discover_socket() -> str | None:
+    """Scan /tmp for ``attic-<pid>.sock`` files and return the best one.
+
+    Shared by the sync and async clients.  Stale sockets (whose PID no longer
+    exists) are unlinked.  Returns the most recently modified live socket, or
+    ``None`` if none found.
+    """
+    pattern = f"{SOCKET_PATH_PREFIX}*{SOCKET_PATH_SUFFIX}"
+    candidates: list[tuple[float, str]] = []
+
+    for path in glob.glob(pattern):
+        # Extract PID from the filename: /tmp/attic-<pid>.sock
+        basename = os.path.basename(path)
+        pid_str = basename.removeprefix("attic-").removesuffix(".sock")
+        try:
+            pid = int(pid_str)
+        except ValueError:
+            continue
+
+        # Check if the process is still alive.
+        if not _pid_alive(pid):
+            # Clean up stale socket file.
+            try:
+                os.unlink(path)
+                logger.debug("Removed stale socket: %s", path)
+            except OSError:
+                pass
+            continue
+
+        # Use modification time for sorting (most recent first).
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            continue
+        candidates.append((mtime, path))
+
+    if not candidates:
+        return None
+
+    # Sort by modification time, most recent first.
+    candidates.sort(key=lambda t: t[0], reverse=True)
+    return candidates[0][1]
+
+
 def _pid_alive(pid: int) -> bool:
     """Check if a process with the given PID is running.
 
@@ -12,7 +12,7 @@ decorators.  FastMCP automatically:
 
 Each tool function is a thin translation layer: it formats the arguments into
 a CLI protocol command, sends it over the Unix socket to AtticServer, and
-returns the text response (or an Image for screenshots).
+returns the text response (or image content for screenshots).
 
 Run with::
 
@@ -27,24 +27,33 @@ For development with the MCP Inspector::
 from __future__ import annotations
 
 import asyncio
+import base64
+import contextlib
 import logging
+import mmap
 import os
+import random
 import shutil
 import subprocess
 import sys
 import time
-from typing import Annotated
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, TypeVar
 
+import anyio
 from pydantic import Field
 
 # FastMCP is the high-level decorator API from the official MCP Python SDK.
 # It lives inside the ``mcp`` package (not the standalone ``fastmcp`` package).
-from mcp.server.fastmcp import FastMCP, Image
+from mcp.server.fastmcp import FastMCP
+from mcp.types import ImageContent
 
 from .cli_client import (
+    AsyncCLISocketClient,
     CLIConnectionError,
-    CLISocketClient,
-    MULTI_LINE_SEP,
+    CLIConnectionPool,
+    CLIError,
     escape_for_inject,
     parse_hex_bytes,
     translate_key,
@@ -65,66 +74,185 @@ logger = logging.getLogger("attic-mcp")
 # FastMCP server instance
 # ---------------------------------------------------------------------------
 
-mcp = FastMCP("AtticMCP")
+
+@contextlib.asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Start connecting to AtticServer while the MCP handshake runs.
+
+    The first tool call then finds the pool already open (or waits on
+    ``_connect_lock`` for the in-flight attempt) instead of paying for
+    discovery and a possible launch itself.
+    """
+    task = asyncio.create_task(_preconnect())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+mcp = FastMCP("AtticMCP", lifespan=_lifespan)
+
+# Shared parameter types.  Each tool adds its own description on top, e.g.
+# ``Annotated[Address, Field(description=...)]``; pydantic merges the two.
+Address = Annotated[int, Field(ge=0, le=0xFFFF)]
+Byte = Annotated[int, Field(ge=0, le=0xFF)]
+Drive = Annotated[int, Field(ge=1, le=8)]
+
+# Hex strings longer than this are parsed in a worker thread so a large
+# write doesn't stall the event loop; shorter ones parse faster inline than
+# a thread hop costs.
+_INLINE_PARSE_LIMIT = 64
 
 # ---------------------------------------------------------------------------
-# Shared CLI socket client — connected lazily on first tool call
+# Shared CLI connection pool — connected at startup, or on first tool call
 # ---------------------------------------------------------------------------
 
-_client = CLISocketClient()
+_pool = CLIConnectionPool()
+
+# Serializes discovery/launch so concurrent first tool calls connect once.
+_connect_lock = asyncio.Lock()
+
+# The few blocking helpers left (socket discovery, large hex parses) run on
+# a small dedicated pool instead of the loop's default executor, which
+# grows to min(32, cpu_count + 4) threads.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="attic-io")
+
+_T = TypeVar("_T")
+
+
+async def _run_blocking(func: Callable[..., _T], *args: object) -> _T:
+    """Run ``func(*args)`` on the dedicated I/O thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+
+
+@contextlib.asynccontextmanager
+async def _client() -> AsyncIterator[AsyncCLISocketClient]:
+    """Check out a live pooled connection, connecting lazily if needed.
 
+    Each caller gets its own pooled connection, so independent tool calls
+    run concurrently instead of queueing behind one socket.  The pool only
+    hands out connections whose stream is still open.
 
-async def _send(command: str) -> str:
+    There is no up-front "is the pool open?" check: a pool that was never
+    opened (or was closed after a failure) refuses to hand out a connection,
+    and that single cold-path failure triggers discovery (or an attempt to
+    launch AtticServer) before retrying.  Once connected, a tool call goes
+    straight to the pooled socket.
+
+    A lost connection is retried up to three times in all, with a jittered
+    exponential backoff so several clients don't reconnect in lockstep
+    when AtticServer restarts.  Commands are never replayed: a connection
+    that drops mid-command surfaces as ``CLIConnectionError``.
+
+    Raises:
+        RuntimeError: If no AtticServer can be found or launched.
+        CLIConnectionError: If no connection can be checked out.
+    """
+    for attempt in range(3):
+        stack = contextlib.AsyncExitStack()
+        try:
+            client = await stack.enter_async_context(_pool.acquire())
+            break
+        except CLIConnectionError:
+            if attempt == 2:
+                raise
+            if _pool.is_open:
+                # The connection was lost — back off (full jitter, 10ms
+                # doubling, capped at 200ms) before reconnecting.  A pool
+                # that was never opened reconnects straight away.
+                _pool.close()
+                await asyncio.sleep(random.uniform(0, min(0.01 * 2**attempt, 0.2)))
+            await _ensure_connected()
+    async with stack:
+        yield client
+
+
+async def _send(command: str, lines: bool = False) -> str:
     """Send a CLI command to AtticServer, connecting lazily if needed.
 
     This is the central bridge between async FastMCP tool handlers and the
-    synchronous CLI socket client.  Socket I/O is offloaded to a thread via
-    ``asyncio.to_thread()`` so it doesn't block the event loop.
-
-    If the client is not yet connected, it discovers a running AtticServer
-    (or attempts to launch one) before sending.
+    CLI socket; see :func:`_client` for connection handling.
 
     Returns:
-        The OK payload from the server response.
+        The OK payload from the server response, with multi-line separators
+        turned into newlines when *lines* is set.
 
     Raises:
         RuntimeError: If no AtticServer can be found or launched.
         CLIError: If the server returns an ERR response.
     """
-    if not _client.is_connected:
-        await _ensure_connected()
+    async with _client() as client:
+        return await client.send(command, lines=lines)
+
+
+async def _preconnect() -> None:
+    """Connect at startup, logging rather than raising if that fails.
+
+    Only an already-running AtticServer is picked up; launching one is left
+    to the first tool call.  A failure here is not fatal: the next tool call
+    retries through ``_client`` and reports the error to the client.
+    """
     try:
-        return await asyncio.to_thread(_client.send, command)
-    except CLIConnectionError:
-        # Connection may have been lost — try reconnecting once.
-        _client.disconnect()
-        await _ensure_connected()
-        return await asyncio.to_thread(_client.send, command)
+        await _ensure_connected(allow_launch=False)
+    except (RuntimeError, CLIConnectionError) as exc:
+        logger.info("AtticServer not available at startup: %s", exc)
 
 
-async def _ensure_connected() -> None:
+async def _ensure_connected(allow_launch: bool = True) -> None:
     """Discover and connect to AtticServer, launching it if necessary.
 
-    If the ``ATTIC_MCP_NO_LAUNCH`` environment variable is set, the server
-    will not attempt to auto-launch AtticServer.  This is used by the test
-    harness to ensure both Swift and Python MCP servers share the same
-    AtticServer instance.
+    If *allow_launch* is false, or the ``ATTIC_MCP_NO_LAUNCH`` environment
+    variable is set, the server will not attempt to auto-launch
+    AtticServer.  The test harness sets the variable to ensure both Swift
+    and Python MCP servers share the same AtticServer instance.
+
+    A reconnect first retries the last socket that worked, so the usual
+    case (AtticServer still running, connection dropped) skips the
+    ``/tmp`` scan entirely.
     """
-    path = await asyncio.to_thread(_client.discover_socket)
-    if path is None and not os.environ.get("ATTIC_MCP_NO_LAUNCH"):
-        logger.info("No AtticServer socket found, attempting to launch...")
-        await asyncio.to_thread(_try_launch_server)
-        path = await asyncio.to_thread(_client.discover_socket)
-    if path is None:
-        raise RuntimeError(
-            "AtticServer not running and could not be launched. "
-            "Start it manually with: swift run AtticServer"
+    async with _connect_lock:
+        if _pool.is_open:
+            return  # Another tool call connected while we waited.
+        cached = _pool.last_known_path
+        if cached is not None:
+            try:
+                await _pool.open(cached)
+                return
+            except CLIConnectionError:
+                logger.info("Socket %s no longer reachable, rediscovering", cached)
+        path = await _run_blocking(
+            _discover_or_launch,
+            allow_launch and not os.environ.get("ATTIC_MCP_NO_LAUNCH"),
         )
-    await asyncio.to_thread(_client.connect, path)
+        if path is None:
+            raise RuntimeError(
+                "AtticServer not running and could not be launched. "
+                "Start it manually with: swift run AtticServer"
+            )
+        await _pool.open(path)
 
 
-def _try_launch_server() -> None:
-    """Attempt to start AtticServer as a background subprocess.
+def _discover_or_launch(allow_launch: bool) -> str | None:
+    """Find the AtticServer socket, launching AtticServer first if allowed.
+
+    Discovery, the launch and the post-launch polling are all blocking, so
+    they run here as one sequence and cost ``_ensure_connected`` a single
+    thread hop.  Returns ``None`` if no socket turns up.
+    """
+    path = _pool.discover_socket()
+    if path is None and allow_launch:
+        logger.info("No AtticServer socket found, attempting to launch...")
+        path = _try_launch_server()
+    return path
+
+
+# Resolved AtticServer executable, remembered once found so reconnects don't
+# re-walk PATH and the candidate directories.
+_cached_exe: str | None = None
+
+
+def _find_exe() -> str | None:
+    """Locate the ``AtticServer`` executable.
 
     Searches for the ``AtticServer`` executable in:
       1. The PATH
@@ -132,8 +260,13 @@ def _try_launch_server() -> None:
       3. Common Swift build output directories (``.build/release``, ``.build/debug``)
       4. Standard install locations (``/usr/local/bin``, ``/opt/homebrew/bin``, ``~/.local/bin``)
 
-    After launching, polls up to 4 seconds for the socket file to appear.
+    A found path is cached for the life of the process; a miss is not, so an
+    AtticServer built after startup is still picked up.
     """
+    global _cached_exe
+    if _cached_exe is not None:
+        return _cached_exe
+
     exe = shutil.which("AtticServer")
 
     if exe is None:
@@ -157,9 +290,24 @@ def _try_launch_server() -> None:
                 exe = candidate
                 break
 
+    _cached_exe = exe
+    return exe
+
+
+def _try_launch_server() -> str | None:
+    """Attempt to start AtticServer as a background subprocess.
+
+    The executable is located with :func:`_find_exe`.  After launching,
+    polls up to 4 seconds for the socket file to appear, backing off
+    exponentially from 10ms to 200ms between scans so a fast launch is
+    noticed almost immediately.  Returns the discovered socket path, or
+    ``None`` if the launch failed or timed out.
+    """
+    exe = _find_exe()
+
     if exe is None:
         logger.warning("AtticServer executable not found")
-        return
+        return None
 
     logger.info("Launching AtticServer from %s", exe)
     subprocess.Popen(
@@ -168,14 +316,19 @@ def _try_launch_server() -> None:
         stderr=subprocess.DEVNULL,
     )
 
-    # Poll for the socket file to appear (up to 4 seconds, every 200ms).
-    for _ in range(20):
-        time.sleep(0.2)
-        if _client.discover_socket() is not None:
+    # Poll for the socket file to appear (up to 4 seconds).
+    delay = 0.01
+    deadline = time.monotonic() + 4.0
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        path = _pool.discover_socket()
+        if path is not None:
             logger.info("AtticServer socket discovered after launch")
-            return
+            return path
+        delay = min(delay * 1.6, 0.2)
 
     logger.warning("AtticServer launched but socket did not appear within 4s")
+    return None
 
 
 # ===========================================================================
@@ -240,8 +393,7 @@ async def emulator_boot_file(
 
 @mcp.tool()
 async def emulator_read_memory(
-    address: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    address: Annotated[Address, Field(
         description="Starting address to read from (0-65535 or 0x0000-0xFFFF)",
     )],
     count: Annotated[int, Field(
@@ -254,13 +406,12 @@ async def emulator_read_memory(
     Returns comma-separated hex values. Emulator should be paused for
     consistent reads of multi-byte values.
     """
-    return await _send(f"read ${address:04X} {count}")
+    return await _send("read $%04X %d" % (address, count))
 
 
 @mcp.tool()
 async def emulator_write_memory(
-    address: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    address: Annotated[Address, Field(
         description="Starting address to write to (0-65535 or 0x0000-0xFFFF)",
     )],
     data: Annotated[str, Field(description=(
@@ -273,9 +424,12 @@ async def emulator_write_memory(
     Emulator must be paused first. The data parameter accepts
     comma-separated, space-separated, or dollar-prefixed hex bytes.
     """
-    bytes_list = parse_hex_bytes(data)
-    hex_str = ",".join(f"{b:02X}" for b in bytes_list)
-    return await _send(f"write ${address:04X} {hex_str}")
+    if len(data) <= _INLINE_PARSE_LIMIT:
+        bytes_list = parse_hex_bytes(data)
+    else:
+        bytes_list = await _run_blocking(parse_hex_bytes, data)
+    # bytes.hex() with a separator formats the whole list in one C call.
+    return await _send("write $%04X %s" % (address, bytes(bytes_list).hex(",").upper()))
 
 
 # ===========================================================================
@@ -295,28 +449,22 @@ async def emulator_get_registers() -> str:
 
 @mcp.tool()
 async def emulator_set_registers(
-    a: Annotated[int | None, Field(
-        ge=0, le=0xFF,
+    a: Annotated[Byte | None, Field(
         description="Accumulator register (0x00-0xFF)",
     )] = None,
-    x: Annotated[int | None, Field(
-        ge=0, le=0xFF,
+    x: Annotated[Byte | None, Field(
         description="X index register (0x00-0xFF)",
     )] = None,
-    y: Annotated[int | None, Field(
-        ge=0, le=0xFF,
+    y: Annotated[Byte | None, Field(
         description="Y index register (0x00-0xFF)",
     )] = None,
-    s: Annotated[int | None, Field(
-        ge=0, le=0xFF,
+    s: Annotated[Byte | None, Field(
         description="Stack pointer register (0x00-0xFF)",
     )] = None,
-    p: Annotated[int | None, Field(
-        ge=0, le=0xFF,
+    p: Annotated[Byte | None, Field(
         description="Processor status register (0x00-0xFF)",
     )] = None,
-    pc: Annotated[int | None, Field(
-        ge=0, le=0xFFFF,
+    pc: Annotated[Address | None, Field(
         description="Program counter (0x0000-0xFFFF)",
     )] = None,
 ) -> str:
@@ -327,19 +475,12 @@ async def emulator_set_registers(
     """
     # Build the register modification string.  The wire format uses 4-digit
     # hex for all values (matching the Swift implementation's $%04X format).
-    parts: list[str] = []
-    if a is not None:
-        parts.append(f"A=${a:04X}")
-    if x is not None:
-        parts.append(f"X=${x:04X}")
-    if y is not None:
-        parts.append(f"Y=${y:04X}")
-    if s is not None:
-        parts.append(f"S=${s:04X}")
-    if p is not None:
-        parts.append(f"P=${p:04X}")
-    if pc is not None:
-        parts.append(f"PC=${pc:04X}")
+    # %-formatting is a single C-level call, cheaper than an f-string here.
+    parts = [
+        "%s=$%04X" % (name, value)
+        for name, value in (("A", a), ("X", x), ("Y", y), ("S", s), ("P", p), ("PC", pc))
+        if value is not None
+    ]
 
     if not parts:
         return "No register values specified. Provide at least one of: a, x, y, s, p, pc"
@@ -380,8 +521,7 @@ async def emulator_execute_frames(
 
 @mcp.tool()
 async def emulator_disassemble(
-    address: Annotated[int | None, Field(
-        ge=0, le=0xFFFF,
+    address: Annotated[Address | None, Field(
         description=(
             "Starting address to disassemble from. "
             "If not specified, disassembles from the current program counter."
@@ -402,23 +542,21 @@ async def emulator_disassemble(
     #   disassemble . <lines>          — current PC, N lines
     #   disassemble $XXXX <lines>      — from address, N lines
     if address is not None and lines != 16:
-        cmd = f"disassemble ${address:04X} {lines}"
+        cmd = "disassemble $%04X %d" % (address, lines)
     elif address is not None:
-        cmd = f"disassemble ${address:04X}"
+        cmd = "disassemble $%04X" % address
     elif lines != 16:
-        cmd = f"disassemble . {lines}"
+        cmd = "disassemble . %d" % lines
     else:
         cmd = "disassemble"
 
-    result = await _send(cmd)
-    # Replace the multi-line separator with actual newlines.
-    return result.replace(MULTI_LINE_SEP, "\n")
+    # Have the client turn the multi-line separator into newlines.
+    return await _send(cmd, lines=True)
 
 
 @mcp.tool()
 async def emulator_set_breakpoint(
-    address: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    address: Annotated[Address, Field(
         description="Memory address to set the breakpoint at (0x0000-0xFFFF)",
     )],
 ) -> str:
@@ -427,18 +565,17 @@ async def emulator_set_breakpoint(
     The debugger uses the 6502 BRK instruction ($00) for breakpoints.
     When the program counter reaches this address, execution will pause.
     """
-    return await _send(f"breakpoint set ${address:04X}")
+    return await _send("breakpoint set $%04X" % address)
 
 
 @mcp.tool()
 async def emulator_clear_breakpoint(
-    address: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    address: Annotated[Address, Field(
         description="Memory address to clear the breakpoint from (0x0000-0xFFFF)",
     )],
 ) -> str:
     """Clear a previously set breakpoint at the given address."""
-    return await _send(f"breakpoint clear ${address:04X}")
+    return await _send("breakpoint clear $%04X" % address)
 
 
 @mcp.tool()
@@ -490,8 +627,7 @@ async def emulator_get_screen_text(
     without taking a pixel screenshot.
     """
     cmd = "screen atascii" if atascii else "screen"
-    result = await _send(cmd)
-    return result.replace(MULTI_LINE_SEP, "\n")
+    return await _send(cmd, lines=True)
 
 
 @mcp.tool()
@@ -515,19 +651,31 @@ async def emulator_screenshot(
     # The CLI response contains the path to the saved PNG file.
     png_path = result.strip()
 
-    # Try to return the actual image data via FastMCP's Image helper.
+    # Try to return the actual image data as MCP image content.
     # This is an improvement over the Swift version, which only returns
     # the file path as text.  If the file can't be read, fall back to text.
     expanded = os.path.expanduser(png_path)
     if os.path.isfile(expanded):
         try:
-            return Image(path=expanded)
+            return _png_content(expanded)
         except Exception:
             pass
 
     return f"Screenshot saved to: {png_path}"
 
 
+def _png_content(path: str) -> ImageContent:
+    """Base64-encode a PNG file into MCP image content.
+
+    The file is memory-mapped and encoded straight from the mapping, which
+    avoids the full-file ``bytes`` copy that FastMCP's ``Image(path=...)``
+    makes before encoding.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = base64.b64encode(mm).decode("ascii")
+    return ImageContent(type="image", data=data, mimeType="image/png")
+
+
 # ===========================================================================
 #  TOOLS — BASIC
 # ===========================================================================
@@ -545,8 +693,7 @@ async def emulator_list_basic(
     Returns the detokenized BASIC source code with line numbers.
     """
     cmd = "basic LIST atascii" if atascii else "basic LIST"
-    result = await _send(cmd)
-    return result.replace(MULTI_LINE_SEP, "\n")
+    return await _send(cmd, lines=True)
 
 
 # ===========================================================================
@@ -556,8 +703,7 @@ async def emulator_list_basic(
 
 @mcp.tool()
 async def emulator_mount_disk(
-    drive: Annotated[int, Field(
-        ge=1, le=8,
+    drive: Annotated[Drive, Field(
         description="Drive number (1-8)",
     )],
     path: Annotated[str, Field(
@@ -570,8 +716,7 @@ async def emulator_mount_disk(
 
 @mcp.tool()
 async def emulator_unmount_disk(
-    drive: Annotated[int, Field(
-        ge=1, le=8,
+    drive: Annotated[Drive, Field(
         description="Drive number (1-8)",
     )],
 ) -> str:
@@ -602,8 +747,7 @@ async def emulator_step_over() -> str:
 
 @mcp.tool()
 async def emulator_run_until(
-    address: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    address: Annotated[Address, Field(
         description="Target address to run until the program counter reaches (0x0000-0xFFFF)",
     )],
 ) -> str:
@@ -612,13 +756,12 @@ async def emulator_run_until(
     Useful for running to a specific point in the code without setting
     a permanent breakpoint.
     """
-    return await _send(f"until ${address:04X}")
+    return await _send("until $%04X" % address)
 
 
 @mcp.tool()
 async def emulator_assemble(
-    address: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    address: Annotated[Address, Field(
         description="Memory address to assemble the instruction at (0x0000-0xFFFF)",
     )],
     instruction: Annotated[str, Field(description=(
@@ -636,8 +779,7 @@ async def emulator_assemble(
 
 @mcp.tool()
 async def emulator_assemble_block(
-    address: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    address: Annotated[Address, Field(
         description="Starting memory address to assemble at (0x0000-0xFFFF)",
     )],
     instructions: Annotated[list[str], Field(
@@ -655,45 +797,69 @@ async def emulator_assemble_block(
     instruction in order, then ends the session.  This is more efficient
     than calling emulator_assemble repeatedly because the address advances
     automatically.  Returns each assembled line and a summary.
+
+    All instructions are sent together, so an instruction that fails to
+    assemble does not stop the block: the instructions after it are still
+    assembled and written to memory, shifted down by the failed
+    instruction's missing bytes.  The error then names the failed
+    instruction numbers and lists every line's result.
     """
-    # Start the interactive assembly session.
-    await _send(f"assemble ${address:04X}")
+    # The assembly session is per connection on the server, so the whole
+    # block goes through a single pooled connection.
+    async with _client() as client:
+        # Start the interactive assembly session.
+        await client.send(f"assemble ${address:04X}")
 
-    assembled_lines: list[str] = []
-    try:
-        for instr in instructions:
-            result = await _send(f"assemble input {instr}")
-            # The server returns "<formatted-line>\x1e<next-addr>".
-            # We keep the formatted line (before the separator).
-            line = result.split(MULTI_LINE_SEP)[0] if MULTI_LINE_SEP in result else result
-            assembled_lines.append(line)
-    except Exception:
-        # Clean up the session on error so the server isn't left with
-        # a dangling assembly session for this client.
         try:
-            await _send("assemble end")
+            # Pipeline every instruction in one write: one round trip for
+            # the whole block instead of one per instruction.
+            results = await client.send_pipeline(
+                [f"assemble input {instr}" for instr in instructions],
+                lines=True,
+                return_exceptions=True,
+            )
         except Exception:
-            pass
-        raise
-
-    # End the session and capture the summary.
-    summary = await _send("assemble end")
-
-    return "\n".join(assembled_lines) + "\n" + summary
+            # Clean up the session on error so the server isn't left with
+            # a dangling assembly session for this client.
+            try:
+                await client.send("assemble end")
+            except Exception:
+                pass
+            raise
+
+        # End the session and capture the summary.
+        summary = await client.send("assemble end")
+
+    # The server returns "<formatted-line>\x1e<next-addr>", which the client
+    # hands back newline-joined (lines=True).  We keep the formatted line.
+    assembled_lines: list[str] = []
+    failed: list[int] = []
+    for number, (instr, result) in enumerate(zip(instructions, results), 1):
+        if isinstance(result, CLIError):
+            failed.append(number)
+            assembled_lines.append(f"#{number} {instr}: error: {result}")
+        else:
+            assembled_lines.append(result.split("\n", 1)[0])
+
+    output = "\n".join(assembled_lines) + "\n" + summary
+    if failed:
+        raise CLIError(
+            "Assembly failed at instruction %s; the instructions after it "
+            "were still assembled and written:\n%s"
+            % (", ".join(f"#{number}" for number in failed), output)
+        )
+    return output
 
 
 @mcp.tool()
 async def emulator_fill_memory(
-    start: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    start: Annotated[Address, Field(
         description="Start address of the range to fill (0x0000-0xFFFF)",
     )],
-    end: Annotated[int, Field(
-        ge=0, le=0xFFFF,
+    end: Annotated[Address, Field(
         description="End address of the range to fill, inclusive (0x0000-0xFFFF)",
     )],
-    value: Annotated[int, Field(
-        ge=0, le=0xFF,
+    value: Annotated[Byte, Field(
         description="Byte value to fill the range with (0x00-0xFF)",
     )],
 ) -> str:
@@ -704,7 +870,7 @@ async def emulator_fill_memory(
     """
     if end < start:
         return f"Error: end address (${end:04X}) must be >= start address (${start:04X})"
-    return await _send(f"fill ${start:04X} ${end:04X} ${value:02X}")
+    return await _send("fill $%04X $%04X $%02X" % (start, end, value))
 
 
 # ===========================================================================
@@ -752,8 +918,19 @@ def main() -> None:
     Starts the FastMCP server using stdio transport (JSON-RPC 2.0 over
     stdin/stdout).  This is the standard transport for local MCP servers
     used by Claude Code and similar clients.
+
+    Runs on a uvloop event loop when uvloop is installed; the server is pure
+    asyncio I/O (stdio in, Unix socket out), which is where uvloop helps.
+    The loop is requested from anyio directly rather than through the
+    deprecated global event-loop policy.
     """
-    mcp.run(transport="stdio")
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        use_uvloop = False
+    else:
+        use_uvloop = True
+    anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+"""Shared test fixtures for the AtticMCP test suite."""
+
+import asyncio
+
+import pytest
+
+
+class FakeAtticServer:
+    """Minimal AtticServer stand-in on a Unix socket.
+
+    Answers ``ping`` with ``pong`` and echoes every other command back as
+    its ``OK:`` payload.  Start it from inside the test's event loop.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: list[asyncio.StreamWriter] = []
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_unix_server(self._handle, self.path)
+
+    def drop_connections(self) -> None:
+        """Close every open connection, as a restarting server would."""
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def stop(self) -> None:
+        """Stop listening and drop all connections."""
+        self.drop_connections()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        self._writers.append(writer)
+        while line := await reader.readline():
+            command = line.decode().rstrip("\n").removeprefix("CMD:")
+            reply = "pong" if command == "ping" else command
+            writer.write(f"OK:{reply}\n".encode())
+
+
+@pytest.fixture
+def fake_server(tmp_path):
+    """Return a factory for FakeAtticServer instances under ``tmp_path``."""
+    return lambda name="attic.sock": FakeAtticServer(str(tmp_path / name))
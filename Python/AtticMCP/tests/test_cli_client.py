@@ -0,0 +1,138 @@
+"""Tests for the async CLI socket client."""
+
+import asyncio
+import socket
+
+import pytest
+
+from attic_mcp.cli_client import (
+    AsyncCLISocketClient,
+    CLIConnectionError,
+    CLIConnectionPool,
+    CLITimeoutError,
+)
+
+
+async def _attach(client: AsyncCLISocketClient) -> socket.socket:
+    """Wire *client* to one end of a socketpair and return the other end."""
+    local, remote = socket.socketpair()
+    client._reader, client._writer = await asyncio.open_unix_connection(sock=local)
+    return remote
+
+
+class TestCancellation:
+    def test_cancelled_send_drops_stream(self):
+        async def scenario():
+            client = AsyncCLISocketClient()
+            remote = await _attach(client)
+            try:
+                task = asyncio.create_task(client.send("slow"))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                assert not client.is_connected
+                # The late reply to "slow" must never reach a later command.
+                with pytest.raises(CLIConnectionError):
+                    await client.send("registers")
+            finally:
+                client.disconnect()
+                remote.close()
+
+        asyncio.run(scenario())
+
+    def test_cancelled_pipeline_drops_stream(self):
+        async def scenario():
+            client = AsyncCLISocketClient()
+            remote = await _attach(client)
+            try:
+                remote.sendall(b"OK:first\n")
+                task = asyncio.create_task(client.send_pipeline(["a", "slow"]))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                assert not client.is_connected
+            finally:
+                client.disconnect()
+                remote.close()
+
+        asyncio.run(scenario())
+
+
+class TestStaleReplies:
+    def test_late_reply_after_timeout_is_discarded(self):
+        async def scenario():
+            client = AsyncCLISocketClient()
+            remote = await _attach(client)
+            try:
+                with pytest.raises(CLITimeoutError):
+                    await client.send("slow", timeout=0.05)
+                assert client.is_connected
+                remote.sendall(b"OK:reply-to-slow\nOK:reply-to-registers\n")
+                assert await client.send("registers") == "reply-to-registers"
+            finally:
+                client.disconnect()
+                remote.close()
+
+        asyncio.run(scenario())
+
+    def test_pipeline_timeout_discards_outstanding_replies(self):
+        async def scenario():
+            client = AsyncCLISocketClient()
+            remote = await _attach(client)
+            try:
+                remote.sendall(b"OK:a\n")
+                with pytest.raises(CLITimeoutError):
+                    await client.send_pipeline(["a", "b", "c"], timeout=0.05)
+                remote.sendall(b"EVENT:stopped $E000\nOK:b\nOK:c\nOK:status\n")
+                assert await client.send("status") == "status"
+            finally:
+                client.disconnect()
+                remote.close()
+
+        asyncio.run(scenario())
+
+
+class TestConnectionPool:
+    def test_connection_released_after_close_is_not_reused(self, fake_server):
+        async def scenario():
+            server = fake_server()
+            await server.start()
+            pool = CLIConnectionPool()
+            try:
+                await pool.open(server.path)
+                async with pool.acquire() as stale:
+                    pool.close()
+                    await pool.open(server.path)
+                assert not stale.is_connected
+                async with pool.acquire() as client:
+                    assert client is not stale
+                    assert await client.send("status") == "status"
+            finally:
+                pool.close()
+                await server.stop()
+
+        asyncio.run(scenario())
+
+    def test_idle_connection_closed_by_server_is_replaced(self, fake_server):
+        async def scenario():
+            server = fake_server()
+            await server.start()
+            pool = CLIConnectionPool()
+            try:
+                await pool.open(server.path)
+                async with pool.acquire() as first:
+                    pass
+                server.drop_connections()
+                await asyncio.sleep(0.05)
+                async with pool.acquire() as client:
+                    assert client is not first
+                    assert await client.send("status") == "status"
+                assert not first.is_connected
+                assert server.connections == 2
+            finally:
+                pool.close()
+                await server.stop()
+
+        asyncio.run(scenario())
@@ -0,0 +1,75 @@
+"""Tests for the MCP server's connection handling."""
+
+import asyncio
+
+import pytest
+
+from attic_mcp import server
+from attic_mcp.cli_client import CLIConnectionError, CLIConnectionPool
+
+
+def _use_pool(monkeypatch, connect_to: list[str]) -> list[str]:
+    """Give ``server`` a fresh pool whose reconnects open ``connect_to[-1]``.
+
+    Returns the list that records each ``_ensure_connected()`` call.
+    """
+    pool = CLIConnectionPool()
+    calls: list[str] = []
+
+    async def ensure_connected(allow_launch: bool = True) -> None:
+        calls.append("connect")
+        if connect_to:
+            await pool.open(connect_to[-1])
+
+    monkeypatch.setattr(server, "_pool", pool)
+    monkeypatch.setattr(server, "_ensure_connected", ensure_connected)
+    return calls
+
+
+class TestClientCheckout:
+    def test_cold_pool_connects_on_first_use(self, monkeypatch, fake_server):
+        async def scenario():
+            attic = fake_server()
+            await attic.start()
+            calls = _use_pool(monkeypatch, [attic.path])
+            try:
+                assert await server._send("status") == "status"
+                assert await server._send("status") == "status"
+                assert calls == ["connect"]
+            finally:
+                server._pool.close()
+                await attic.stop()
+
+        asyncio.run(scenario())
+
+    def test_reconnects_after_server_restart(self, monkeypatch, fake_server):
+        async def scenario():
+            first = fake_server("first.sock")
+            await first.start()
+            paths = [first.path]
+            calls = _use_pool(monkeypatch, paths)
+            second = fake_server("second.sock")
+            try:
+                assert await server._send("status") == "status"
+                # AtticServer restarts under a new socket path.
+                await first.stop()
+                await second.start()
+                paths.append(second.path)
+                await asyncio.sleep(0.05)
+                assert await server._send("status") == "status"
+                assert calls == ["connect", "connect"]
+                assert second.connections == 1
+            finally:
+                server._pool.close()
+                await second.stop()
+
+        asyncio.run(scenario())
+
+    def test_gives_up_after_three_attempts(self, monkeypatch):
+        async def scenario():
+            calls = _use_pool(monkeypatch, [])
+            with pytest.raises(CLIConnectionError):
+                await server._send("status")
+            assert calls == ["connect", "connect"]
+
+        asyncio.run(scenario())
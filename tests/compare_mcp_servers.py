@@ -21,8 +21,9 @@ Shared AtticServer safety:
     Both MCP servers connect to the same AtticServer instance via socket
     discovery (``/tmp/attic-*.sock``).  This is safe because:
 
-    1. Tool calls are sent **sequentially** — Swift first, then Python —
-       so there is no interleaved socket I/O.
+    1. The servers take turns — all Swift tool calls complete before the
+       Python ones are sent — so there is no interleaved socket I/O
+       between them.
     2. Only **read-only** tools are called (status, registers, memory read,
        disassemble, list breakpoints, list drives, list BASIC).
     3. Each MCP server maintains its own independent socket connection to
@@ -49,13 +50,18 @@ Usage::
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import json
 import os
+import queue
+import re
+import shlex
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import IO, Any
 
 # ---------------------------------------------------------------------------
 # Project root detection — the script lives in tests/ under the repo root
@@ -63,6 +69,22 @@ from typing import Any
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# ---------------------------------------------------------------------------
+# JSON-RPC framing — orjson when available (bytes in and out, no separate
+# encode/decode step), otherwise the stdlib json module
+# ---------------------------------------------------------------------------
+
+try:
+    import orjson
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+else:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
 # ---------------------------------------------------------------------------
 # ANSI colour helpers
 # ---------------------------------------------------------------------------
@@ -100,6 +122,23 @@ def dim(s: str) -> str:
     return f"{DIM}{s}{RESET}"
 
 
+# Colour only when writing to a terminal and NO_COLOR is unset; otherwise
+# every helper returns its argument unchanged.
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    def _plain(s: str) -> str:
+        return s
+
+    red = green = yellow = cyan = bold = dim = _plain
+
+# Horizontal rule framing the report header and the overall summary.
+_RULE = bold("=" * 70)
+
+# Per-check labels, coloured once rather than on every message.
+_PASS = green("PASS")
+_FAIL = red("FAIL")
+_WARN = yellow("WARN")
+
+
 # ---------------------------------------------------------------------------
 # Result tracking
 # ---------------------------------------------------------------------------
@@ -115,27 +154,30 @@ class CompareResult:
 
     def ok(self, msg: str) -> None:
         self.passed += 1
-        self.messages.append(f"  {green('PASS')} {msg}")
+        self.messages.append(f"  {_PASS} {msg}")
 
     def fail(self, msg: str) -> None:
         self.failed += 1
-        self.messages.append(f"  {red('FAIL')} {msg}")
+        self.messages.append(f"  {_FAIL} {msg}")
 
     def warn(self, msg: str) -> None:
         self.warned += 1
-        self.messages.append(f"  {yellow('WARN')} {msg}")
+        self.messages.append(f"  {_WARN} {msg}")
 
     def print_all(self) -> None:
-        for m in self.messages:
-            print(m)
+        # One write for the whole block rather than a print() per line,
+        # which flushes every line when stdout is a terminal.
+        if self.messages:
+            sys.stdout.write("\n".join(self.messages) + "\n")
 
     def summary_line(self) -> str:
-        parts = [green(f"{self.passed} passed")]
+        # At most three segments: concatenate rather than join a list.
+        line = green(f"{self.passed} passed")
         if self.failed:
-            parts.append(red(f"{self.failed} failed"))
+            line += ", " + red(f"{self.failed} failed")
         if self.warned:
-            parts.append(yellow(f"{self.warned} warnings"))
-        return ", ".join(parts)
+            line += ", " + yellow(f"{self.warned} warnings")
+        return line
 
 
 # ---------------------------------------------------------------------------
@@ -162,7 +204,17 @@ class MCPProcess:
         self.cwd = cwd
         self.env_overrides = env_overrides or {}
         self.proc: subprocess.Popen[bytes] | None = None
+        # The pipes, cached by start() so each message skips the Popen
+        # attribute chain and its None checks.
+        self._stdin: IO[bytes] | None = None
+        self._stdout: IO[bytes] | None = None
         self._request_id = 0
+        # stdout is read with blocking readline() calls on a daemon thread
+        # that feeds this queue, so that a read can time out; see
+        # _read_response().
+        self._lines: queue.Queue[bytes] | None = None
+        # Responses read while waiting for a different request id.
+        self._pending: dict[int, dict[str, Any]] = {}
 
     def start(self) -> None:
         """Launch the MCP server subprocess.
@@ -182,6 +234,17 @@ class MCPProcess:
             cwd=self.cwd,
             env=env,
         )
+        self._stdin = self.proc.stdin
+        self._stdout = self.proc.stdout
+        self._lines = queue.Queue()
+        # A daemon thread never holds up interpreter exit, even when some
+        # orphaned child keeps stdout open after the server is terminated.
+        threading.Thread(
+            target=_pump_lines,
+            args=(self._stdout, self._lines),
+            name=f"{self.name}-stdout",
+            daemon=True,
+        ).start()
 
     def stop(self) -> None:
         """Terminate the subprocess."""
@@ -192,6 +255,8 @@ class MCPProcess:
             except Exception:
                 self.proc.kill()
             self.proc = None
+            self._stdin = self._stdout = None
+            self._lines = None
 
     def send(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Send a JSON-RPC request and return the parsed response.
@@ -206,83 +271,122 @@ class MCPProcess:
         Raises:
             RuntimeError: If the process is not started or the read times out.
         """
-        if self.proc is None or self.proc.stdin is None or self.proc.stdout is None:
-            raise RuntimeError(f"{self.name}: process not started")
+        return self.wait_response(self.start_request(method, params))
 
-        self._request_id += 1
-        request: dict[str, Any] = {
-            "jsonrpc": "2.0",
-            "id": self._request_id,
-            "method": method,
-        }
+    def start_request(self, method: str, params: dict[str, Any] | None = None) -> int:
+        """Write a JSON-RPC request without waiting for its response.
+
+        Returns the request id to pass to :meth:`wait_response`.  This lets
+        the harness send the same request to both servers before reading
+        either reply, so their latencies overlap instead of adding up.
+
+        Raises:
+            RuntimeError: If the process is not started.
+        """
+        return self.start_encoded(self.encode_request(method, params))
+
+    @staticmethod
+    def encode_request(method: str, params: dict[str, Any] | None = None) -> bytes:
+        """Serialize a JSON-RPC request, minus its id, for :meth:`start_encoded`.
+
+        The result can be written to several servers; only the id differs.
+        """
+        request: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
         if params is not None:
             request["params"] = params
+        # Drop the opening brace so start_encoded() can splice the id in,
+        # and include the line terminator.
+        return _dumps(request)[1:] + b"\n"
+
+    def start_encoded(self, encoded: bytes) -> int:
+        """Write a request from :meth:`encode_request` and return its id.
+
+        Raises:
+            RuntimeError: If the process is not started.
+        """
+        if self._stdin is None:
+            raise RuntimeError(f"{self.name}: process not started")
+
+        self._request_id += 1
+        # The pieces gather in the pipe's write buffer; flush() issues one
+        # write(2) for the whole line without concatenating it first.
+        self._stdin.writelines((b'{"id":%d,' % self._request_id, encoded))
+        self._stdin.flush()
+        return self._request_id
+
+    def wait_response(self, request_id: int, timeout: float = 30.0) -> dict[str, Any]:
+        """Return the response to ``request_id``, reading until it arrives.
 
-        line = json.dumps(request) + "\n"
-        self.proc.stdin.write(line.encode("utf-8"))
-        self.proc.stdin.flush()
+        Responses to other outstanding requests are kept for their own
+        :meth:`wait_response` call.
 
-        # Read one line of response (with timeout via poll).
-        return self._read_response(timeout=30.0)
+        Raises:
+            RuntimeError: If the read times out.
+        """
+        if request_id in self._pending:
+            return self._pending.pop(request_id)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                msg = self._read_response(deadline)
+            except queue.Empty:
+                raise RuntimeError(
+                    f"{self.name}: timed out waiting for response after {timeout}s"
+                ) from None
+            if msg["id"] == request_id:
+                return msg
+            self._pending[msg["id"]] = msg
 
     def send_notification(self, method: str, params: dict[str, Any] | None = None) -> None:
         """Send a JSON-RPC notification (no id, no response expected)."""
-        if self.proc is None or self.proc.stdin is None:
+        if self._stdin is None:
             raise RuntimeError(f"{self.name}: process not started")
 
         msg: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
         if params is not None:
             msg["params"] = params
 
-        line = json.dumps(msg) + "\n"
-        self.proc.stdin.write(line.encode("utf-8"))
-        self.proc.stdin.flush()
+        self._stdin.writelines((_dumps(msg), b"\n"))
+        self._stdin.flush()
 
-    def _read_response(self, timeout: float) -> dict[str, Any]:
+    def _read_response(self, deadline: float) -> dict[str, Any]:
         """Read a single JSON-RPC response line from stdout.
 
         Skips any notification lines (messages without an ``id`` field) and
-        returns the first response that has an ``id``.  Uses a polling loop
-        with a deadline so we don't block forever on a broken server.
+        returns the first response that has an ``id``.  Each line comes from
+        a blocking ``readline()`` run on the reader thread, so the wait ends
+        as soon as a line arrives but can still give up at ``deadline`` (a
+        ``time.monotonic()`` value) with ``queue.Empty``; a line that
+        arrives after a timeout stays queued for the next call.
         """
-        assert self.proc is not None and self.proc.stdout is not None
-
-        import select
+        if self._lines is None:
+            raise RuntimeError(f"{self.name}: process not started")
 
-        deadline = time.monotonic() + timeout
-        buf = b""
+        while True:
+            line_bytes = self._lines.get(
+                timeout=max(deadline - time.monotonic(), 0.0)
+            )
 
-        while time.monotonic() < deadline:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                break
+            if not line_bytes:
+                raise RuntimeError(f"{self.name}: server closed its output")
 
-            # Use select to wait for data with a timeout.
-            rlist, _, _ = select.select([self.proc.stdout], [], [], min(remaining, 1.0))
-            if not rlist:
+            try:
+                msg = _loads(line_bytes)
+            except ValueError:
+                # Blank lines, non-JSON output and invalid UTF-8 alike.
                 continue
+            # Skip notifications (no id field) and error responses
+            # to notifications (id is null).
+            if "id" in msg and msg["id"] is not None:
+                return msg
+
 
-            chunk = self.proc.stdout.read1(4096) if hasattr(self.proc.stdout, "read1") else self.proc.stdout.read(1)
-            if not chunk:
-                break
-            buf += chunk
-
-            # Process complete lines.
-            while b"\n" in buf:
-                line_bytes, buf = buf.split(b"\n", 1)
-                line_str = line_bytes.decode("utf-8", errors="replace").strip()
-                if not line_str:
-                    continue
-                try:
-                    msg = json.loads(line_str)
-                except json.JSONDecodeError:
-                    continue
-                # Skip notifications (no id field) and error responses
-                # to notifications (id is null).
-                if "id" in msg and msg["id"] is not None:
-                    return msg
-
-        raise RuntimeError(f"{self.name}: timed out waiting for response after {timeout}s")
+def _pump_lines(stdout: IO[bytes], lines: queue.Queue[bytes]) -> None:
+    """Copy lines from ``stdout`` into ``lines``, ending with ``b""`` at EOF."""
+    for line in iter(stdout.readline, b""):
+        lines.put(line)
+    lines.put(b"")
 
 
 # ---------------------------------------------------------------------------
@@ -374,13 +478,15 @@ def compare_tools_list(
     swift_tools: dict[str, dict] = {t["name"]: t for t in swift_tools_raw}
     python_tools: dict[str, dict] = {t["name"]: t for t in python_tools_raw}
 
-    swift_names = set(swift_tools.keys())
-    python_names = set(python_tools.keys())
-
     # -- Tool set comparison ------------------------------------------------
-    only_swift = swift_names - python_names
-    only_python = python_names - swift_names
-    common = swift_names & python_names
+    # Classify names in one pass over each index; dict lookups stand in for
+    # building and differencing separate name sets.
+    common: list[str] = []
+    only_swift: list[str] = []
+    for name in swift_tools:
+        (common if name in python_tools else only_swift).append(name)
+    only_python = [name for name in python_tools if name not in swift_tools]
+    common.sort()
 
     if not only_swift and not only_python:
         result.ok(f"Tool sets match: {len(common)} tools in both")
@@ -392,9 +498,15 @@ def compare_tools_list(
         result.ok(f"Common tools: {len(common)}")
 
     # -- Per-tool comparison ------------------------------------------------
-    for name in sorted(common):
+    for name in common:
         st = swift_tools[name]
         pt = python_tools[name]
+        # Identical definitions need no field-by-field walk.
+        if (st.get("description"), st.get("inputSchema")) == (
+            pt.get("description"), pt.get("inputSchema")
+        ):
+            result.ok(f"[{name}] Description and input schema identical")
+            continue
         _compare_single_tool(name, st, pt, result, verbose)
 
     if verbose:
@@ -470,6 +582,11 @@ def _compare_property(
     """Compare a single property schema between Swift and Python."""
     prefix = f"[{tool_name}.{prop_name}]"
 
+    # Equal schemas (one C-level deep compare) pass every check below.
+    if swift_prop == python_prop:
+        result.ok(f"{prefix} Schema identical")
+        return
+
     # -- Type ---------------------------------------------------------------
     s_type = _extract_type(swift_prop)
     p_type = _extract_type(python_prop)
@@ -530,6 +647,46 @@ def _compare_property(
             result.messages.append(f"          Python: {dim(_trunc(p_desc, 90))}")
 
 
+# Safe read-only tools with their test arguments.
+SAFE_CALLS: list[tuple[str, dict[str, Any]]] = [
+    ("emulator_status", {}),
+    ("emulator_get_registers", {}),
+    ("emulator_list_breakpoints", {}),
+    ("emulator_list_drives", {}),
+    ("emulator_read_memory", {"address": 0, "count": 16}),
+    ("emulator_disassemble", {"address": 0xE000, "lines": 5}),
+    ("emulator_list_basic", {}),
+]
+
+# Each tools/call request serialized once and written to both servers.
+_SAFE_CALL_REQUESTS: list[tuple[str, bytes]] = [
+    (name, MCPProcess.encode_request("tools/call", make_tool_call_params(name, args)))
+    for name, args in SAFE_CALLS
+]
+
+
+def _pipeline_safe_calls(proc: MCPProcess) -> list[dict[str, Any] | RuntimeError]:
+    """Write every safe tools/call request to ``proc``, then read the replies.
+
+    The servers don't accept JSON-RPC batches (MCP 2024-11-05 has none), so
+    pipelining stands in for one: one round trip for all calls instead of
+    one per call.  A call that fails yields its ``RuntimeError`` in place of
+    a reply.
+    """
+    try:
+        request_ids = [proc.start_encoded(request) for _, request in _SAFE_CALL_REQUESTS]
+    except RuntimeError as exc:
+        return [exc] * len(_SAFE_CALL_REQUESTS)
+
+    replies: list[dict[str, Any] | RuntimeError] = []
+    for request_id in request_ids:
+        try:
+            replies.append(proc.wait_response(request_id))
+        except RuntimeError as exc:
+            replies.append(exc)
+    return replies
+
+
 def compare_tool_calls(
     swift_proc: MCPProcess,
     python_proc: MCPProcess,
@@ -540,29 +697,23 @@ def compare_tool_calls(
     Only calls tools that don't modify emulator state (read-only).  Requires
     a running AtticServer that both MCP servers connect to independently.
 
-    Calls are made **sequentially** (Swift first, then Python for each tool)
-    so both servers never send commands to AtticServer simultaneously.  Since
-    only read-only tools are tested, the emulator state is identical for both.
+    Each server gets all of its calls pipelined (written before any reply
+    is read), but the servers take turns — Swift finishes before Python
+    starts — so both servers never send commands to AtticServer
+    simultaneously.  Since only read-only tools are tested, the emulator
+    state is identical for both.
     """
     result = CompareResult()
 
-    # Safe read-only tools with their test arguments.
-    safe_calls: list[tuple[str, dict[str, Any]]] = [
-        ("emulator_status", {}),
-        ("emulator_get_registers", {}),
-        ("emulator_list_breakpoints", {}),
-        ("emulator_list_drives", {}),
-        ("emulator_read_memory", {"address": 0, "count": 16}),
-        ("emulator_disassemble", {"address": 0xE000, "lines": 5}),
-        ("emulator_list_basic", {}),
-    ]
-
-    for tool_name, args in safe_calls:
+    swift_replies = _pipeline_safe_calls(swift_proc)
+    python_replies = _pipeline_safe_calls(python_proc)
+
+    for (tool_name, _), swift_resp, python_resp in zip(
+        _SAFE_CALL_REQUESTS, swift_replies, python_replies,
+    ):
         prefix = f"[call:{tool_name}]"
-        try:
-            swift_resp = swift_proc.send("tools/call", make_tool_call_params(tool_name, args))
-            python_resp = python_proc.send("tools/call", make_tool_call_params(tool_name, args))
-        except RuntimeError as exc:
+        exc = swift_resp if isinstance(swift_resp, RuntimeError) else python_resp
+        if isinstance(exc, RuntimeError):
             result.fail(f"{prefix} Call failed: {exc}")
             continue
 
@@ -605,19 +756,9 @@ def _extract_type(prop: dict) -> str:
     if "type" in prop:
         return str(prop["type"])
 
-    if "anyOf" in prop:
-        types = []
-        for item in prop["anyOf"]:
-            if "type" in item:
-                types.append(str(item["type"]))
-        return "|".join(sorted(types))
-
-    if "oneOf" in prop:
-        types = []
-        for item in prop["oneOf"]:
-            if "type" in item:
-                types.append(str(item["type"]))
-        return "|".join(sorted(types))
+    for key in ("anyOf", "oneOf"):
+        if key in prop:
+            return "|".join(sorted(str(item["type"]) for item in prop[key] if "type" in item))
 
     return "unknown"
 
@@ -671,6 +812,11 @@ def _constraints_equivalent(
 def _extract_text_content(result: dict) -> str:
     """Extract the text from a ToolCallResult content array."""
     content = result.get("content", [])
+    # Common case: a single text item, returned without building a list.
+    if len(content) == 1:
+        item = content[0]
+        if type(item) is dict and item.get("type") == "text":
+            return item.get("text", "")
     texts = []
     for item in content:
         if isinstance(item, dict):
@@ -693,24 +839,26 @@ def _trunc(s: str, max_len: int) -> str:
 # Main
 # ---------------------------------------------------------------------------
 
+_ATTIC_SOCK_RE = re.compile(r"attic-(\d+)\.sock")
+
+
 def check_attic_server_running() -> bool:
     """Check if an AtticServer is reachable via a /tmp/attic-*.sock socket.
 
     Returns True if a live socket was found, False otherwise.  This is used
     as a pre-flight check before running Level 3 (tools/call) comparisons.
     """
-    import glob as globmod
-    import signal
-
-    for path in globmod.glob("/tmp/attic-*.sock"):
-        basename = os.path.basename(path)
-        pid_str = basename.removeprefix("attic-").removesuffix(".sock")
-        try:
-            pid = int(pid_str)
-            os.kill(pid, 0)  # Signal 0 = check existence.
-            return True
-        except (ValueError, ProcessLookupError, PermissionError):
-            continue
+    # One directory scan with a name match, instead of glob's fnmatch pass.
+    with os.scandir("/tmp") as entries:
+        for entry in entries:
+            m = _ATTIC_SOCK_RE.fullmatch(entry.name)
+            if m is None:
+                continue
+            try:
+                os.kill(int(m.group(1)), 0)  # Signal 0 = check existence.
+                return True
+            except (ProcessLookupError, PermissionError):
+                continue
     return False
 
 
@@ -750,22 +898,22 @@ def main() -> None:
 
     # Build server commands.
     if args.swift_cmd:
-        swift_cmd = args.swift_cmd.split()
+        swift_cmd = shlex.split(args.swift_cmd)
     else:
         swift_cmd = ["swift", "run", "--package-path", REPO_ROOT, "AtticMCP"]
 
     if args.python_cmd:
-        python_cmd = args.python_cmd.split()
+        python_cmd = shlex.split(args.python_cmd)
     else:
         python_dir = os.path.join(REPO_ROOT, "Python", "AtticMCP")
         python_cmd = ["uv", "run", "--directory", python_dir, "attic-mcp"]
 
-    print(bold("=" * 70))
+    print(_RULE)
     print(bold("  AtticMCP Server Comparison Harness"))
-    print(bold("=" * 70))
+    print(_RULE)
     print()
-    print(f"  Swift command:  {' '.join(swift_cmd)}")
-    print(f"  Python command: {' '.join(python_cmd)}")
+    print(f"  Swift command:  {shlex.join(swift_cmd)}")
+    print(f"  Python command: {shlex.join(python_cmd)}")
     print()
 
     # -- Pre-flight check for --with-calls ----------------------------------
@@ -788,21 +936,28 @@ def main() -> None:
     swift = MCPProcess("Swift", swift_cmd, cwd=REPO_ROOT, env_overrides=no_launch_env)
     python = MCPProcess("Python", python_cmd, cwd=REPO_ROOT, env_overrides=no_launch_env)
 
+    exit_code = 0
     try:
         print(f"{cyan('Starting servers...')}")
-        swift.start()
-        python.start()
-        # Give them a moment to initialise.
-        time.sleep(2)
+        # Spawn both at once; start() raises here if either command fails
+        # to launch.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(MCPProcess.start, (swift, python)))
+        # No start-up delay: the initialize request waits in each server's
+        # stdin pipe until it is ready, and the reply is the readiness signal.
 
         # -- Initialize handshake -------------------------------------------
         print()
         print(bold("--- Level 1: Initialize ---"))
         print()
 
+        # Levels 1 and 2 don't touch AtticServer, so each request goes to
+        # both servers before either reply is read.
         init_params = make_initialize_params()
-        swift_init = swift.send("initialize", init_params)
-        python_init = python.send("initialize", init_params)
+        swift_id = swift.start_request("initialize", init_params)
+        python_id = python.start_request("initialize", init_params)
+        swift_init = swift.wait_response(swift_id)
+        python_init = python.wait_response(python_id)
 
         if verbose:
             print(f"  Swift initialize response:  {json.dumps(swift_init, indent=2)[:500]}")
@@ -815,19 +970,23 @@ def main() -> None:
         print(f"\n  Initialize: {init_result.summary_line()}")
 
         # Send initialized notification (required by MCP protocol).
+        # Each server reads stdin in order, so the notification is handled
+        # before the tools/list request that follows it; no delay needed.
         swift.send_notification("initialized")
         python.send_notification("initialized")
 
-        # Small delay for servers to process the notification.
-        time.sleep(0.5)
-
         # -- Tools list comparison ------------------------------------------
         print()
         print(bold("--- Level 2: tools/list ---"))
         print()
 
-        swift_tools = swift.send("tools/list", {})
-        python_tools = python.send("tools/list", {})
+        # Each tools/list reply is one JSON line (about 19KB for AtticMCP)
+        # that parses in well under a millisecond, so it is read whole
+        # rather than stream-decoded.
+        swift_id = swift.start_request("tools/list", {})
+        python_id = python.start_request("tools/list", {})
+        swift_tools = swift.wait_response(swift_id)
+        python_tools = python.wait_response(python_id)
 
         if verbose:
             s_count = len(swift_tools.get("result", {}).get("tools", []))
@@ -854,33 +1013,37 @@ def main() -> None:
             print(f"\n  tools/call: {calls_result.summary_line()}")
 
         # -- Overall summary ------------------------------------------------
-        print()
-        print(bold("=" * 70))
-        total_passed = init_result.passed + tools_result.passed + calls_result.passed
-        total_failed = init_result.failed + tools_result.failed + calls_result.failed
-        total_warned = init_result.warned + tools_result.warned + calls_result.warned
-        total = total_passed + total_failed + total_warned
-
-        parts = [green(f"{total_passed} passed")]
-        if total_failed:
-            parts.append(red(f"{total_failed} failed"))
-        if total_warned:
-            parts.append(yellow(f"{total_warned} warnings"))
-
-        print(f"  {bold('Overall')}: {', '.join(parts)} ({total} checks)")
-        print(bold("=" * 70))
+        overall = CompareResult()
+        for level_result in (init_result, tools_result, calls_result):
+            overall.passed += level_result.passed
+            overall.failed += level_result.failed
+            overall.warned += level_result.warned
+        total = overall.passed + overall.failed + overall.warned
+
+        # Emit the whole summary block with one write.
+        sys.stdout.write(
+            f"\n{_RULE}\n"
+            f"  {bold('Overall')}: {overall.summary_line()} ({total} checks)\n"
+            f"{_RULE}\n"
+        )
+        sys.stdout.flush()
 
-        if total_failed > 0:
-            sys.exit(1)
+        if overall.failed > 0:
+            exit_code = 1
 
     except RuntimeError as exc:
         print(red(f"\nError: {exc}"))
-        sys.exit(2)
+        exit_code = 2
     except KeyboardInterrupt:
         print("\nInterrupted.")
+        exit_code = 130
     finally:
-        swift.stop()
-        python.stop()
+        # Each stop() may wait up to 5s for its server to exit; overlap them.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(MCPProcess.stop, (swift, python)))
+
+    # The one exit point, reached after both servers are stopped.
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":